@@ -4,16 +4,44 @@ Data Quality Scanner - Streamlit Application
 A web application for scanning CSV files and detecting common data quality issues.
 """
 
+import hashlib
+import io
+import os
+import pickle
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 import streamlit as st
 import pandas as pd
 import numpy as np
-from scanner import DataQualityChecker, ReportGenerator
+from scanner import DataQualityChecker, ReportGenerator, RESULTS_FORMAT_VERSION
 import plotly.graph_objects as go
-from io import StringIO
 import base64
 from datetime import datetime
 
 
+# Check results kept in Streamlit's in-memory cache; each holds a frame-length duplicate mask
+RESULTS_MEMORY_CACHE_ENTRIES = 8
+
+# Text columns with fewer distinct values than this share of rows are stored as categoricals
+CATEGORY_UNIQUE_RATIO = 0.5
+
+# Evenly spaced rows whose distinct values screen out mostly-unique text columns
+CATEGORY_PROBE_ROWS = 10_000
+
+# Larger frames are first shown with results from a sample of this many rows
+FAST_SAMPLE_ROWS = 50_000
+
+# Exact scans of large frames that may run at once across all sessions
+BACKGROUND_SCAN_WORKERS = 4
+
+# Exact results persisted across sessions, keyed by dataset fingerprint
+RESULTS_CACHE_DIR = Path(__file__).resolve().parent / '.dqs_cache'
+
+# Persisted results kept on disk; the least recently used beyond this are deleted
+RESULTS_CACHE_MAX_ENTRIES = 100
+
+
 def main():
     """Main Streamlit application."""
     st.set_page_config(
@@ -52,9 +80,12 @@ def main():
             # Load the CSV file
             if isinstance(uploaded_file, pd.DataFrame):
                 df = uploaded_file
+                fingerprint = dataframe_fingerprint(df)
                 st.success("Sample data loaded successfully!")
             else:
-                df = pd.read_csv(uploaded_file)
+                # Identical uploads share results, so key them by their raw bytes
+                fingerprint = hashlib.sha256(uploaded_file.getvalue()).hexdigest()
+                df = load_csv(uploaded_file)
                 st.success(f"File '{uploaded_file.name}' loaded successfully!")
             
             # Display basic info
@@ -72,10 +103,25 @@ def main():
             st.header("Data Quality Analysis")
             
             with st.spinner("Analyzing data quality..."):
-                checker = DataQualityChecker(df)
-                results = checker.run_all_checks()
+                results, exact_status = get_results(fingerprint, df)
                 reporter = ReportGenerator(results, df)
             
+            if 'approx' in results:
+                approx = results['approx']
+                if exact_status == 'failed':
+                    st.warning(
+                        f"The full scan failed, so these results come from a random sample of "
+                        f"{approx['sample_rows']:,} of {approx['total_rows']:,} rows. "
+                        "Sampled duplicate counts understate the full dataset."
+                    )
+                else:
+                    st.info(
+                        f"Showing results for a random sample of {approx['sample_rows']:,} of "
+                        f"{approx['total_rows']:,} rows while the full scan runs in the background. "
+                        "Sampled duplicate counts understate the full dataset."
+                    )
+                    st.button("Refresh results")
+            
             # Display results in tabs
             tab1, tab2, tab3, tab4, tab5 = st.tabs([
                 "Overview", 
@@ -145,6 +191,192 @@ def main():
         display_welcome_screen()
 
 
+class _ProgressReader(io.RawIOBase):
+    """Binary stream over an upload that reports the share of bytes read so far."""
+    
+    def __init__(self, raw, total_bytes, progress_bar):
+        """Wrap ``raw``, expected to hold ``total_bytes``, updating ``progress_bar``."""
+        super().__init__()
+        self._raw = raw
+        self._total_bytes = max(total_bytes, 1)
+        self._bytes_read = 0
+        self._percent_shown = 0
+        self._progress_bar = progress_bar
+    
+    def readable(self):
+        """Report the stream as readable so pandas treats it as a binary file."""
+        return True
+    
+    def readinto(self, buffer):
+        """Fill ``buffer`` from the upload and advance the progress bar."""
+        count = self._raw.readinto(buffer)
+        self._bytes_read += count
+        # The parser reads in blocks of a few hundred KB; redraw only on whole percents
+        percent = min(100, self._bytes_read * 100 // self._total_bytes)
+        if percent > self._percent_shown:
+            self._percent_shown = percent
+            self._progress_bar.progress(percent / 100, text=f"Reading CSV... {percent}%")
+        return count
+
+
+def load_csv(uploaded_file):
+    """Read an uploaded CSV in one pass, with a progress bar following the bytes parsed."""
+    uploaded_file.seek(0)
+    progress_bar = st.progress(0.0, text="Reading CSV...")
+    try:
+        return pd.read_csv(_ProgressReader(uploaded_file, uploaded_file.size, progress_bar))
+    finally:
+        progress_bar.empty()
+
+
+def downcast_dataframe(df):
+    """
+    Return a copy of the frame with narrower column dtypes and the same values.
+    
+    Integers take the smallest integer type that holds them, floats drop to
+    float32 only when every value survives the round trip exactly, and
+    repetitive text columns become categoricals. Only the checks run on the
+    narrowed copy; the dashboard describes the frame as it was parsed.
+    """
+    df = df.copy(deep=False)
+    for column in df.select_dtypes(include='integer').columns:
+        df[column] = pd.to_numeric(df[column], downcast='integer')
+    
+    for column in df.select_dtypes(include='floating').columns:
+        values = df[column].to_numpy()
+        narrowed = values.astype(np.float32)
+        if np.array_equal(narrowed.astype(values.dtype), values, equal_nan=True):
+            df[column] = narrowed
+    
+    for column in df.select_dtypes(include=['object', 'string']).columns:
+        # A probe that is already mostly distinct rules the column out without
+        # hashing every row; a wrong guess only leaves a column as text
+        probe = df[column].iloc[::max(1, len(df) // CATEGORY_PROBE_ROWS)]
+        if probe.nunique() >= len(probe) * CATEGORY_UNIQUE_RATIO:
+            continue
+        
+        # One factorize both counts the distinct values and builds the codes
+        codes, uniques = pd.factorize(df[column])
+        if len(uniques) < len(df) * CATEGORY_UNIQUE_RATIO:
+            df[column] = pd.Categorical.from_codes(codes, uniques)
+    
+    return df
+
+
+def dataframe_fingerprint(df):
+    """Return a content hash of a DataFrame used as the cache key for its checks."""
+    hasher = hashlib.sha256()
+    hasher.update(repr((df.shape, list(df.columns), [str(d) for d in df.dtypes])).encode())
+    hasher.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return hasher.hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=RESULTS_MEMORY_CACHE_ENTRIES)
+def run_checks(fingerprint, _df, mode='exact'):
+    """
+    Run all data quality checks, cached across Streamlit reruns.
+    
+    The DataFrame is passed with a leading underscore so Streamlit skips
+    hashing it; the precomputed fingerprint is the cache key instead.
+    Exact results are also persisted on disk so later sessions reuse them.
+    """
+    if mode == 'exact':
+        return run_exact_checks(fingerprint, _df)
+    return DataQualityChecker(_df, mode=mode, sample_rows=FAST_SAMPLE_ROWS).run_all_checks()
+
+
+def run_exact_checks(fingerprint, df):
+    """Return exact results from the on-disk cache, computing them on a downcast copy and storing them on a miss."""
+    results = load_cached_results(fingerprint)
+    if results is None:
+        results = DataQualityChecker(downcast_dataframe(df)).run_all_checks()
+        store_cached_results(fingerprint, results)
+    return results
+
+
+def _cache_path(fingerprint):
+    """Return the on-disk cache file for a fingerprint under the current results format."""
+    return RESULTS_CACHE_DIR / f"{fingerprint}-r{RESULTS_FORMAT_VERSION}.pkl"
+
+
+def load_cached_results(fingerprint):
+    """Load persisted results for a fingerprint, or None if absent or unreadable."""
+    path = _cache_path(fingerprint)
+    try:
+        with open(path, 'rb') as cache_file:
+            results = pickle.load(cache_file)
+        # Mark the entry as recently used so eviction keeps it
+        os.utime(path)
+        return results
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+
+
+def store_cached_results(fingerprint, results):
+    """
+    Persist results atomically; failing to write the cache never fails the scan.
+    
+    Private entries such as the frame-length duplicate mask are left out, and
+    the least recently used files beyond RESULTS_CACHE_MAX_ENTRIES are deleted.
+    """
+    path = _cache_path(fingerprint)
+    try:
+        RESULTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(temp_path, 'wb') as cache_file:
+            pickle.dump(_without_private_keys(results), cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except OSError:
+        return
+    
+    try:
+        entries = sorted(RESULTS_CACHE_DIR.glob('*.pkl'), key=lambda entry: entry.stat().st_mtime, reverse=True)
+        for stale_path in entries[RESULTS_CACHE_MAX_ENTRIES:]:
+            stale_path.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+@st.cache_resource
+def background_executor():
+    """
+    Return the pool that runs exact checks for large frames while sampled results are on screen.
+    
+    Streamlit re-executes this script on every rerun, so the pool lives in the
+    resource cache to be created once and shared by all sessions.
+    """
+    return ThreadPoolExecutor(max_workers=BACKGROUND_SCAN_WORKERS)
+
+
+def get_results(fingerprint, df):
+    """
+    Return check results and the state of the exact scan behind them.
+    
+    Small frames are checked exactly right away. Larger ones start an exact
+    scan in a background thread, at most one per session, and show sampled
+    results until it completes, or for good if it fails. The state is None
+    for exact results, otherwise 'running' or 'failed'.
+    """
+    if len(df) <= FAST_SAMPLE_ROWS or _cache_path(fingerprint).exists():
+        return run_checks(fingerprint, df), None
+    
+    pending = st.session_state.get('exact_checks')
+    if pending is None or pending[0] != fingerprint:
+        if pending is not None:
+            # The session moved on to another dataset; a scan that has not
+            # started yet is dropped, one already running finishes and is cached
+            pending[1].cancel()
+        future = background_executor().submit(run_exact_checks, fingerprint, df)
+        pending = st.session_state['exact_checks'] = (fingerprint, future)
+    
+    future = pending[1]
+    if not future.done():
+        return run_checks(fingerprint, df, mode='fast'), 'running'
+    if future.exception() is not None:
+        return run_checks(fingerprint, df, mode='fast'), 'failed'
+    return future.result(), None
+
+
 def display_welcome_screen():
     """Display the welcome screen when no file is uploaded."""
     st.markdown("""
@@ -231,15 +463,21 @@ def display_missing_values_tab(reporter, results):
     # Detailed table
     st.subheader("Missing Values by Column")
     
+    approx = results.get('approx')
     missing_data = []
     for col, data in missing_values.items():
         if data['has_missing']:
-            missing_data.append({
+            row = {
                 'Column': col,
                 'Missing Count': data['count'],
                 'Missing Percentage': f"{data['percentage']}%",
                 'Status': 'Critical' if data['percentage'] > 20 else 'Warning' if data['percentage'] > 5 else 'Low'
-            })
+            }
+            if approx:
+                # 95% margin of error of a proportion estimated from a uniform sample
+                p = data['percentage'] / 100
+                row['Margin of Error'] = f"±{1.96 * np.sqrt(p * (1 - p) / approx['sample_rows']) * 100:.2f}%"
+            missing_data.append(row)
     
     if missing_data:
         missing_df = pd.DataFrame(missing_data)
@@ -277,13 +515,23 @@ def display_duplicates_tab(reporter, results):
         st.metric("Duplicate Percentage", f"{duplicates['percentage']}%")
     
     with col2:
-        st.metric("Unique Rows", results['summary']['total_rows'] - duplicates['count'])
-        st.metric("Total Rows", results['summary']['total_rows'])
+        # Sampled results count duplicates among the sampled rows only
+        rows_checked = results['summary']['total_rows']
+        st.metric("Unique Rows", rows_checked - duplicates['count'])
+        st.metric("Rows Checked" if 'approx' in results else "Total Rows", rows_checked)
     
     # Show duplicate rows if not too many
     if duplicates['count'] <= 50:
         st.subheader("Duplicate Rows Preview")
-        duplicate_rows = reporter.df[reporter.df.duplicated(keep=False)]
+        if '_mask' in duplicates:
+            duplicate_mask = duplicates['_mask']
+        else:
+            # Results loaded from the disk cache carry only the row labels
+            duplicate_mask = pd.Series(reporter.df.index.isin(duplicates['duplicate_rows']), index=reporter.df.index)
+        if 'approx' in results:
+            # Sampled results only cover the sampled rows
+            duplicate_mask = duplicate_mask.reindex(reporter.df.index, fill_value=False)
+        duplicate_rows = reporter.df[duplicate_mask]
         st.dataframe(duplicate_rows, use_container_width=True)
     
     # Recommendations
@@ -339,40 +587,51 @@ def display_detailed_report_tab(reporter, results):
     
     # Raw results (for debugging/advanced users)
     with st.expander("Raw Results (JSON)"):
-        st.json(results)
+        st.json(_without_private_keys(results))
 
 
-def create_sample_data():
-    """Create sample data with common data quality issues."""
-    np.random.seed(42)
-    
+def _without_private_keys(value):
+    """Drop private (underscore-prefixed) entries such as cached masks before display or persistence."""
+    if isinstance(value, dict):
+        return {k: _without_private_keys(v) for k, v in value.items() if not str(k).startswith('_')}
+    return value
+
+
+@st.cache_data(show_spinner=False)
+def _build_sample_data():
+    """
+    Build the sample dataset with common data quality issues from pre-typed arrays.
+    
+    Streamlit re-executes this script on every rerun, so the frame is built
+    once in the data cache, which hands each caller its own copy.
+    """
     # Create sample data with intentional issues
     data = {
-        'customer_id': [1, 2, None, 4, 1, 6, None, 8, 9, 10, 11, 12, 13, None, 15],
-        'email': [
+        'customer_id': np.array([1, 2, np.nan, 4, 1, 6, np.nan, 8, 9, 10, 11, 12, 13, np.nan, 15], dtype=np.float64),
+        'email': np.array([
             'john@email.com', 'jane@email.com', 'bob@email.com', 'alice@email.com',
             'john@email.com', 'charlie@email.com', 'diana@email.com', 'eve@email.com',
             'invalid-email', 'frank@email.com', 'grace@email.com', 'henry@email.com',
             'invalid-email', 'invalid@', 'iris@email.com'
-        ],
-        'purchase_date': [
+        ], dtype=object),
+        'purchase_date': np.array([
             '2024-01-15', '2024-01-16', '15/01/2024', '2024-01-18',
             '2024-01-15', '2024-01-20', '20/01/2024', '2024-01-22',
             '2024-01-23', '2024-01-24', '24/01/2024', '2024-01-26',
             '2024-01-27', '27/01/2024', '2024-01-29'
-        ],
-        'amount': [100.50, 85.00, 120.75, 95.25, 100.50, 150.00, 'invalid', 75.50, 200.00, 90.00, 110.25, 85.75, 300.00, 95.50, 125.00],
-        'category': ['Electronics', 'Books', 'Electronics', 'Clothing', 'Electronics', 'Books', 'Electronics', 'Clothing', 'Electronics', 'Books', 'Electronics', 'Clothing', 'Electronics', 'Books', 'Electronics']
+        ], dtype=object),
+        # Deliberately mixed: one non-numeric entry among the amounts
+        'amount': np.array([100.50, 85.00, 120.75, 95.25, 100.50, 150.00, 'invalid', 75.50, 200.00, 90.00, 110.25, 85.75, 300.00, 95.50, 125.00], dtype=object),
+        'category': np.array(['Electronics', 'Books', 'Electronics', 'Clothing', 'Electronics', 'Books', 'Electronics', 'Clothing', 'Electronics', 'Books', 'Electronics', 'Clothing', 'Electronics', 'Books', 'Electronics'], dtype=object)
     }
     
-    df = pd.DataFrame(data)
-    
-    # Create a file-like object
-    csv_buffer = StringIO()
-    df.to_csv(csv_buffer, index=False)
-    csv_buffer.seek(0)
-    
-    return df
+    return pd.DataFrame(data)
+
+
+# The sample is constant, so it is built once at import time
+def create_sample_data():
+    """Return a fresh copy of the sample data with common data quality issues."""
+    return _build_sample_data()
 
 
 if __name__ == "__main__":
@@ -11,8 +11,8 @@ This package provides functionality to scan CSV files for:
 __version__ = "1.0.0"
 __author__ = "Data Quality Scanner Team"
 
-from .checks import DataQualityChecker
+from .checks import DataQualityChecker, RESULTS_FORMAT_VERSION
 from .reporting import ReportGenerator
 
-__all__ = ["DataQualityChecker", "ReportGenerator"]
+__all__ = ["DataQualityChecker", "ReportGenerator", "RESULTS_FORMAT_VERSION"]
 
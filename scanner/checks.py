@@ -5,20 +5,104 @@ This module provides functions to detect common data quality issues
 including missing values, duplicates, and schema inconsistencies.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 import re
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pyarrow is optional; string checks fall back to the .str accessor
+    pa = None
+    pc = None
+
+
+# Version of the results layout and of what the checks report for a given
+# frame; bump it with any change to either so persisted results are not reused
+RESULTS_FORMAT_VERSION = 2
+
+# Column-name keywords (matched as substrings) that mark likely date / numeric columns
+_DATE_KEYWORDS_RE = re.compile('date|time|created|updated|timestamp', re.IGNORECASE)
+_NUMERIC_KEYWORDS_RE = re.compile('id|count|amount|price|quantity|number|total', re.IGNORECASE)
+
+# Dash-separated ISO 8601 calendar date at the start of a value (no lookarounds,
+# so Arrow-backed strings match it with RE2)
+_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}(?:\D|$)')
+
+# Other numeric date layouts, told apart when a column mixes date formats
+_DATE_LAYOUTS = {
+    'MM/DD/YYYY': r'\d{2}/\d{2}/\d{4}',
+    'MM-DD-YYYY': r'\d{2}-\d{2}-\d{4}',
+    'YYYY/MM/DD': r'\d{4}/\d{2}/\d{2}',
+}
+_DATE_LAYOUT_RE = re.compile('^(?:' + '|'.join(f'({pattern})' for pattern in _DATE_LAYOUTS.values()) + ')')
+
+# Rows hashed per block when fingerprinting rows for duplicate detection
+_HASH_CHUNK_ROWS = 100_000
+
+# Share of rows sharing a hash beyond which the whole frame goes through duplicated
+_DUPLICATE_CANDIDATE_SHARE = 0.5
+
+
+@lru_cache(maxsize=1024)
+def _name_matches(keywords_re: re.Pattern, column_name: Any) -> bool:
+    """Return whether a column name contains any keyword, memoized per name."""
+    return keywords_re.search(str(column_name)) is not None
 
 
 class DataQualityChecker:
     """Main class for performing data quality checks on CSV files."""
     
-    def __init__(self, df: pd.DataFrame):
-        """Initialize with a pandas DataFrame."""
-        self.df = df
+    # Rows sampled when enumerating the concrete types of a mixed column
+    _TYPE_PROBE_SIZE = 1000
+    
+    # Compiled once per process and matched against whole values. The Arrow
+    # path hands the pattern to RE2, which matches in linear time without
+    # backtracking; there ``$`` only matches at the very end, so both paths
+    # reject a value with a trailing newline
+    _EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+    _EMAIL_RE2_PATTERN = f'^(?:{_EMAIL_RE.pattern})$'
+    
+    # Outlier values kept in the results; the full set can be arbitrarily large
+    _OUTLIER_SAMPLE_SIZE = 50
+    
+    # Schema validation runs columns in parallel from this many columns upwards
+    _PARALLEL_COLUMN_THRESHOLD = 16
+    
+    CHECK_MODES = ('exact', 'fast')
+    
+    def __init__(self, df: pd.DataFrame, mode: str = 'exact', sample_rows: int = 50_000):
+        """
+        Initialize with a pandas DataFrame.
+        
+        Args:
+            df: Data to check
+            mode: 'exact' checks every row; 'fast' checks a uniform random sample
+                of at most ``sample_rows`` rows and marks the results as approximate
+            sample_rows: Sample size used in 'fast' mode
+        """
+        if mode not in self.CHECK_MODES:
+            raise ValueError(f"mode must be one of {self.CHECK_MODES}, got {mode!r}")
+        
         self.results = {}
+        if mode == 'fast' and len(df) > sample_rows:
+            self.df = df.sample(n=sample_rows, random_state=0)
+            self.results['approx'] = {
+                'sample_rows': sample_rows,
+                'total_rows': len(df)
+            }
+        else:
+            self.df = df
+        
+        # Non-null row masks of partially missing columns, kept by run_all_checks
+        # between the missing value and schema passes
+        self._non_null_masks = {}
         
     def check_missing_values(self) -> Dict[str, Any]:
         """
@@ -27,17 +111,33 @@ class DataQualityChecker:
         Returns:
             Dict containing missing value statistics per column
         """
-        missing_stats = {}
+        return self._count_missing_values(keep_non_null_masks=False)
+    
+    def _count_missing_values(self, keep_non_null_masks: bool) -> Dict[str, Any]:
+        """Compute missing value statistics, optionally keeping masks for schema validation."""
         total_rows = len(self.df)
         
-        for column in self.df.columns:
-            missing_count = self.df[column].isnull().sum()
-            missing_percentage = (missing_count / total_rows) * 100
-            
-            missing_stats[column] = {
-                'count': int(missing_count),
-                'percentage': round(missing_percentage, 2),
-                'has_missing': missing_count > 0
+        # One null-mask reduction over the whole frame instead of a scan per column
+        null_mask = self.df.isnull()
+        missing_counts = null_mask.sum()
+        missing_percentages = (missing_counts / total_rows * 100).round(2)
+        
+        missing_stats = {
+            column: {
+                'count': int(missing_counts[column]),
+                'percentage': float(missing_percentages[column]),
+                'has_missing': bool(missing_counts[column] > 0)
+            }
+            for column in self.df.columns
+        }
+        
+        # The same mask selects the non-null values for schema validation, so
+        # partially missing columns are not scanned for nulls a second time
+        if keep_non_null_masks:
+            self._non_null_masks = {
+                column: ~null_mask.iloc[:, position].to_numpy()
+                for position, column in enumerate(self.df.columns)
+                if 0 < missing_counts.iloc[position] < total_rows
             }
             
         self.results['missing_values'] = missing_stats
@@ -50,15 +150,19 @@ class DataQualityChecker:
         Returns:
             Dict containing duplicate row statistics
         """
-        duplicate_count = self.df.duplicated().sum()
         total_rows = len(self.df)
-        duplicate_percentage = (duplicate_count / total_rows) * 100
+        
+        # Every occurrence of a duplicated row, not just the repeats
+        row_mask, duplicate_count = _find_duplicate_rows(self.df)
+        duplicate_percentage = (duplicate_count / total_rows) * 100 if total_rows else 0.0
+        duplicate_mask = pd.Series(row_mask, index=self.df.index)
         
         duplicate_stats = {
             'count': int(duplicate_count),
             'percentage': round(duplicate_percentage, 2),
             'has_duplicates': duplicate_count > 0,
-            'duplicate_rows': self.df[self.df.duplicated(keep=False)].index.tolist() if duplicate_count > 0 else []
+            'duplicate_rows': self.df.index[duplicate_mask].tolist(),
+            '_mask': duplicate_mask
         }
         
         self.results['duplicates'] = duplicate_stats
@@ -71,27 +175,74 @@ class DataQualityChecker:
         Returns:
             Dict containing schema validation results per column
         """
-        schema_issues = {}
+        columns = list(self.df.columns)
         
-        for column in self.df.columns:
-            column_data = self.df[column].dropna()
-            if len(column_data) == 0:
-                continue
-                
-            issues = self._detect_column_issues(column, column_data)
-            if issues:
-                schema_issues[column] = issues
+        # Columns are independent, so wide frames fan out across a thread pool.
+        # Only the NumPy and Arrow kernels release the GIL; object-dtype type
+        # inference, .str methods and dateutil parsing hold it, so the speedup
+        # depends on how much of a frame is numeric or Arrow-backed text
+        if len(columns) >= self._PARALLEL_COLUMN_THRESHOLD:
+            max_workers = min(len(columns), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                column_issues = list(executor.map(self._check_column, columns, (series for _, series in self.df.items())))
+        else:
+            column_issues = [self._check_column(column, series) for column, series in self.df.items()]
+        
+        schema_issues = {
+            column: issues
+            for column, issues in zip(columns, column_issues)
+            if issues
+        }
+        
+        # The masks only serve this pass; free them rather than hold a
+        # frame-length array per column for the checker's lifetime
+        self._non_null_masks = {}
                 
         self.results['schema_issues'] = schema_issues
         return schema_issues
     
-    def _detect_column_issues(self, column_name: str, column_data: pd.Series) -> Dict[str, Any]:
+    def _check_column(self, column_name: str, series: pd.Series) -> Dict[str, Any]:
+        """Run schema checks on the non-null values of a single column."""
+        # Reuse the frame-wide null mask when it is available: columns with no
+        # missing values skip the copy, all-missing ones skip entirely and the
+        # rest are filtered by their stored mask instead of dropna
+        missing = self.results.get('missing_values', {}).get(column_name)
+        if missing is not None and missing['count'] == 0:
+            column_data = series
+        elif missing is not None and missing['count'] == len(self.df):
+            return {}
+        elif column_name in self._non_null_masks:
+            column_data = series[self._non_null_masks[column_name]]
+        else:
+            column_data = series.dropna()
+        
+        if len(column_data) == 0:
+            return {}
+        
+        # Categoricals are checked on their distinct values, weighted by how
+        # often each occurs, rather than expanded back to one value per row
+        if isinstance(column_data.dtype, pd.CategoricalDtype):
+            codes = column_data.cat.codes.to_numpy()
+            occurrences = np.bincount(codes, minlength=len(column_data.cat.categories))
+            used = np.flatnonzero(occurrences)
+            value_positions = np.zeros(len(occurrences), dtype=np.intp)
+            value_positions[used] = np.arange(len(used))
+            values = pd.Series(column_data.cat.categories[used], name=column_data.name)
+            return self._detect_column_issues(column_name, values, occurrences[used], value_positions[codes])
+        return self._detect_column_issues(column_name, column_data)
+    
+    def _detect_column_issues(self, column_name: str, column_data: pd.Series,
+                              weights: Optional[np.ndarray] = None,
+                              codes: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """
         Detect specific issues in a column.
         
         Args:
             column_name: Name of the column
-            column_data: Non-null data in the column
+            column_data: Non-null data in the column, or its distinct values
+                when ``weights`` and ``codes`` are given
+            weights: Number of rows holding each distinct value
+            codes: Position in ``column_data`` of each row's value
             
         Returns:
             Dict containing detected issues
@@ -99,122 +250,216 @@ class DataQualityChecker:
         issues = {}
         
         # Check for mixed data types
-        data_types = set(type(val).__name__ for val in column_data)
+        data_types = self._detect_value_types(column_data)
         if len(data_types) > 1:
             issues['mixed_types'] = {
                 'detected_types': list(data_types),
-                'count': len(column_data)
+                'count': len(column_data) if weights is None else int(weights.sum())
             }
         
         # Check for date format inconsistencies
         if self._looks_like_date_column(column_name, column_data):
-            date_issues = self._check_date_formats(column_data)
+            date_issues = self._check_date_formats(column_data, weights)
             if date_issues:
                 issues['date_formats'] = date_issues
         
         # Check for numeric inconsistencies
         if self._looks_like_numeric_column(column_name, column_data):
-            numeric_issues = self._check_numeric_consistency(column_data)
+            numeric_issues = self._check_numeric_consistency(column_data, codes)
             if numeric_issues:
                 issues['numeric_issues'] = numeric_issues
         
         # Check for string inconsistencies (length, patterns)
-        if column_data.dtype == 'object':
-            string_issues = self._check_string_consistency(column_data)
+        if pd.api.types.is_string_dtype(column_data.dtype):
+            string_issues = self._check_string_consistency(column_data, weights)
             if string_issues:
                 issues['string_issues'] = string_issues
         
         return issues
     
+    def _detect_value_types(self, column_data: pd.Series) -> set:
+        """
+        Return the Python type names present in a column when it mixes types.
+        
+        Typed (non-object) columns are homogeneous by construction, and pandas'
+        C-level infer_dtype rules out uniform object columns without a Python loop.
+        Only genuinely mixed columns are scanned, starting with a bounded probe.
+        """
+        if column_data.dtype != object:
+            return set()
+        
+        inferred = pd.api.types.infer_dtype(column_data, skipna=True)
+        if not inferred.startswith('mixed'):
+            return set()
+        
+        data_types = set(type(val).__name__ for val in column_data.head(self._TYPE_PROBE_SIZE))
+        if len(data_types) < 2:
+            data_types = set(type(val).__name__ for val in column_data)
+        return data_types
+    
     def _looks_like_date_column(self, column_name: str, column_data: pd.Series) -> bool:
         """Check if a column likely contains dates."""
-        date_keywords = ['date', 'time', 'created', 'updated', 'timestamp']
-        return any(keyword in column_name.lower() for keyword in date_keywords)
+        return _name_matches(_DATE_KEYWORDS_RE, column_name)
     
     def _looks_like_numeric_column(self, column_name: str, column_data: pd.Series) -> bool:
         """Check if a column likely contains numeric data."""
-        numeric_keywords = ['id', 'count', 'amount', 'price', 'quantity', 'number', 'total']
-        return any(keyword in column_name.lower() for keyword in numeric_keywords)
-    
-    def _check_date_formats(self, column_data: pd.Series) -> Dict[str, Any]:
-        """Check for date format inconsistencies."""
-        date_patterns = [
-            r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
-            r'\d{2}/\d{2}/\d{4}',  # MM/DD/YYYY
-            r'\d{2}-\d{2}-\d{4}',  # MM-DD-YYYY
-            r'\d{4}/\d{2}/\d{2}',  # YYYY/MM/DD
-        ]
-        
-        format_counts = {}
-        for pattern in date_patterns:
-            matches = column_data.astype(str).str.match(pattern, na=False).sum()
-            if matches > 0:
-                format_counts[pattern] = int(matches)
+        return _name_matches(_NUMERIC_KEYWORDS_RE, column_name)
+    
+    def _check_date_formats(self, column_data: pd.Series, weights: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """Check for date format inconsistencies; ``weights`` counts rows per value."""
+        date_strings = column_data.astype(str)
+        
+        # Cheap prefix matches first; a column without any recognised date
+        # layout can hold at most one (free-form) format and needs no parsing.
+        # Patterns go in as text so Arrow-backed strings match them with RE2
+        iso_like = date_strings.str.match(_ISO_DATE_RE.pattern).to_numpy(dtype=bool)
+        layout_like = date_strings.str.match(_DATE_LAYOUT_RE.pattern).to_numpy(dtype=bool)
+        if not (iso_like.any() or layout_like.any()):
+            return {}
+        
+        # Values with an ISO prefix only count as ISO when they parse. Parsing to
+        # UTC lets values with different offsets, or with and without one,
+        # share a single result
+        is_iso = np.zeros(len(date_strings), dtype=bool)
+        iso_dates = pd.to_datetime(date_strings[iso_like], format='ISO8601', errors='coerce', utc=True)
+        is_iso[iso_like] = iso_dates.notna().to_numpy()
+        format_counts = {'ISO8601': _weighted_count(is_iso, weights)}
+        
+        # Bucket the other numeric layouts with one extract over just those rows
+        layout_matches = date_strings[layout_like].str.extract(_DATE_LAYOUT_RE).notna().to_numpy()
+        layout_weights = None if weights is None else weights[layout_like]
+        for position, date_format in enumerate(_DATE_LAYOUTS):
+            format_counts[date_format] = _weighted_count(layout_matches[:, position], layout_weights)
+        
+        # Only the rows in no bucket go through the slow per-element parse
+        is_free_form = ~(is_iso | layout_like)
+        free_form = date_strings[is_free_form]
+        free_form_count = _weighted_count(is_free_form, weights)
+        other_count = 0
+        if len(free_form) > 0:
+            other_dates = pd.to_datetime(free_form, format='mixed', errors='coerce', utc=True)
+            other_count = _weighted_count(
+                other_dates.notna().to_numpy(), None if weights is None else weights[is_free_form]
+            )
+        format_counts['other'] = other_count
         
+        format_counts = {date_format: count for date_format, count in format_counts.items() if count > 0}
         if len(format_counts) > 1:
             return {
                 'multiple_formats': True,
                 'format_distribution': format_counts,
-                'total_records': len(column_data)
+                'unparseable_count': free_form_count - other_count,
+                'total_records': len(column_data) if weights is None else int(weights.sum())
             }
         
         return {}
     
-    def _check_numeric_consistency(self, column_data: pd.Series) -> Dict[str, Any]:
-        """Check for numeric data inconsistencies."""
+    def _check_numeric_consistency(self, column_data: pd.Series, codes: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """Check for numeric data inconsistencies; ``codes`` maps rows to distinct values."""
         issues = {}
         
-        # Try to convert to numeric
-        numeric_data = pd.to_numeric(column_data, errors='coerce')
-        non_numeric_count = numeric_data.isnull().sum() - column_data.isnull().sum()
+        # Convert once to a float buffer; every later step works on this array.
+        # Distinct values are converted once and then gathered back to rows
+        numeric_values = pd.to_numeric(column_data, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+        if codes is not None:
+            numeric_values = numeric_values[codes]
+        valid_mask = ~np.isnan(numeric_values)
+        valid_values = numeric_values[valid_mask]
+        non_numeric_count = valid_mask.size - valid_values.size  # column_data holds no nulls
         
         if non_numeric_count > 0:
             issues['non_numeric_values'] = {
                 'count': int(non_numeric_count),
-                'percentage': round((non_numeric_count / len(column_data)) * 100, 2)
+                'percentage': round((non_numeric_count / valid_mask.size) * 100, 2)
             }
         
-        # Check for outliers using IQR method
-        if len(numeric_data.dropna()) > 0:
-            Q1 = numeric_data.quantile(0.25)
-            Q3 = numeric_data.quantile(0.75)
+        # Check for outliers using IQR method; both quartiles come from one call
+        if valid_values.size > 0:
+            Q1, Q3 = np.percentile(valid_values, [25, 75])
             IQR = Q3 - Q1
             lower_bound = Q1 - 1.5 * IQR
             upper_bound = Q3 + 1.5 * IQR
             
-            outliers = numeric_data[(numeric_data < lower_bound) | (numeric_data > upper_bound)]
-            if len(outliers) > 0:
+            # OR the second comparison into the first mask in place, and only
+            # gather values when something is actually out of range
+            outlier_mask = valid_values < lower_bound
+            outlier_mask |= valid_values > upper_bound
+            outlier_count = int(np.count_nonzero(outlier_mask))
+            if outlier_count > 0:
                 issues['outliers'] = {
-                    'count': len(outliers),
-                    'percentage': round((len(outliers) / len(numeric_data.dropna())) * 100, 2),
-                    'values': outliers.dropna().tolist()
+                    'count': outlier_count,
+                    'percentage': round((outlier_count / valid_values.size) * 100, 2),
+                    'sample_values': valid_values[np.flatnonzero(outlier_mask)[:self._OUTLIER_SAMPLE_SIZE]].tolist()
                 }
         
         return issues
     
-    def _check_string_consistency(self, column_data: pd.Series) -> Dict[str, Any]:
-        """Check for string data inconsistencies."""
+    def _as_arrow_strings(self, column_data: pd.Series):
+        """
+        Return the column as a pyarrow string array, or None if it is not pure strings.
+        
+        Arrow-backed columns convert without copying; object columns holding
+        only ``str`` values are copied once into a contiguous UTF-8 buffer.
+        """
+        if pa is None or pd.api.types.infer_dtype(column_data, skipna=True) != 'string':
+            return None
+        
+        try:
+            arrow_strings = pa.array(column_data, from_pandas=True)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return None
+        
+        if not (pa.types.is_string(arrow_strings.type) or pa.types.is_large_string(arrow_strings.type)):
+            return None
+        return arrow_strings
+    
+    def _check_string_consistency(self, column_data: pd.Series, weights: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """Check for string data inconsistencies; ``weights`` counts rows per value."""
         issues = {}
         
-        # Check for length inconsistencies
-        lengths = column_data.str.len()
-        if lengths.std() > lengths.mean() * 0.5:  # High variance in length
-            issues['length_inconsistency'] = {
-                'mean_length': round(lengths.mean(), 2),
-                'std_length': round(lengths.std(), 2),
-                'min_length': int(lengths.min()),
-                'max_length': int(lengths.max())
-            }
+        # Pure string columns run on Arrow's UTF-8 kernels instead of boxed Python str
+        arrow_strings = self._as_arrow_strings(column_data)
+        
+        # Check for length inconsistencies over one flat integer buffer
+        # (non-string values have no length)
+        if arrow_strings is not None:
+            lengths = pc.utf8_length(arrow_strings).to_numpy().astype(np.int64)
+            length_weights = weights
+        else:
+            lengths = column_data.str.len().to_numpy(dtype=np.float64, na_value=np.nan)
+            has_length = ~np.isnan(lengths)
+            lengths = lengths[has_length].astype(np.int64)
+            length_weights = None if weights is None else weights[has_length]
+        n = lengths.size if length_weights is None else int(length_weights.sum())
+        if n > 1:
+            if length_weights is None:
+                mean_length = lengths.mean()
+                std_length = lengths.std(ddof=1)
+            else:
+                mean_length = np.dot(length_weights, lengths) / n
+                std_length = np.sqrt(np.dot(length_weights, (lengths - mean_length) ** 2) / (n - 1))
+            if std_length > mean_length * 0.5:  # High variance in length
+                issues['length_inconsistency'] = {
+                    'mean_length': round(float(mean_length), 2),
+                    'std_length': round(float(std_length), 2),
+                    'min_length': int(lengths.min()),
+                    'max_length': int(lengths.max())
+                }
         
         # Check for pattern inconsistencies (basic email, phone patterns)
         if 'email' in column_data.name.lower():
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            valid_emails = column_data.str.match(email_pattern, na=False).sum()
-            if valid_emails < len(column_data) * 0.8:  # Less than 80% valid
+            if arrow_strings is not None:
+                is_valid = pc.fill_null(pc.match_substring_regex(arrow_strings, self._EMAIL_RE2_PATTERN), False)
+                is_valid = is_valid.to_numpy(zero_copy_only=False)
+            else:
+                is_valid = column_data.str.fullmatch(self._EMAIL_RE, na=False).to_numpy(dtype=bool)
+            valid_emails = _weighted_count(is_valid, weights)
+            total_values = len(column_data) if weights is None else int(weights.sum())
+            if valid_emails < total_values * 0.8:  # Less than 80% valid
                 issues['email_format'] = {
-                    'valid_count': int(valid_emails),
-                    'invalid_count': int(len(column_data) - valid_emails),
-                    'valid_percentage': round((valid_emails / len(column_data)) * 100, 2)
+                    'valid_count': valid_emails,
+                    'invalid_count': total_values - valid_emails,
+                    'valid_percentage': round(float(valid_emails / total_values) * 100, 2)
                 }
         
         return issues
@@ -225,27 +470,120 @@ class DataQualityChecker:
         
         Returns:
             Complete results from all checks
-        """
-        self.check_missing_values()
-        self.check_duplicates()
-        self.check_schema_validation()
         
-        # Generate summary
-        total_issues = 0
-        if self.results.get('missing_values'):
-            total_issues += sum(1 for col in self.results['missing_values'].values() if col['has_missing'])
-        
-        if self.results.get('duplicates', {}).get('has_duplicates'):
-            total_issues += 1
+        The frame is fixed for the lifetime of the checker, so the checks run
+        once; later calls return the same results.
+        """
+        if 'summary' not in self.results:
+            self._count_missing_values(keep_non_null_masks=True)
+            self.check_duplicates()
+            self.check_schema_validation()
             
-        if self.results.get('schema_issues'):
-            total_issues += len(self.results['schema_issues'])
-        
-        self.results['summary'] = {
-            'total_rows': len(self.df),
-            'total_columns': len(self.df.columns),
-            'total_issues': total_issues,
-            'data_quality_score': max(0, 100 - (total_issues * 10))  # Simple scoring
-        }
+            self.results['summary'] = _build_summary(self.results, len(self.df), len(self.df.columns))
         
         return self.results
+
+
+def _weighted_count(mask: np.ndarray, weights: Optional[np.ndarray]) -> int:
+    """Count the rows selected by a mask over values, each value standing for ``weights`` rows."""
+    if weights is None:
+        return int(np.count_nonzero(mask))
+    return int(weights[mask].sum())
+
+
+def _find_duplicate_rows(df: pd.DataFrame) -> Tuple[np.ndarray, int]:
+    """
+    Find duplicated rows with the same notion of equality as ``DataFrame.duplicated``.
+    
+    Returns the mask of every occurrence of a duplicated row (``keep=False``)
+    and the number of rows repeating an earlier one. Equal rows always hash
+    alike, so rows whose hash is unique are settled without a comparison and
+    only rows sharing a hash go through ``duplicated``, which also resolves
+    hash collisions. When most rows share a hash, as in low-cardinality data,
+    the pre-pass saves nothing and the whole frame is compared instead.
+    Object columns hold values that compare equal but hash differently
+    (``1`` and ``1.0``), so frames with them are compared directly;
+    unhashable cells such as lists are compared by their string form.
+    """
+    if len(df.columns) == 0:
+        return np.zeros(len(df), dtype=bool), 0
+    
+    if (df.dtypes == object).any():
+        try:
+            return _duplicated_rows(df)
+        except TypeError:
+            object_columns = df.select_dtypes(include='object').columns
+            return _duplicated_rows(df.astype({column: str for column in object_columns}))
+    
+    # Repeats within the first block already give most low-cardinality frames
+    # away, before the rest of the frame is hashed for nothing
+    row_hashes = _hash_row_blocks(df.iloc[:_HASH_CHUNK_ROWS])
+    if len(df) > _HASH_CHUNK_ROWS:
+        if _repeated_share(row_hashes) > _DUPLICATE_CANDIDATE_SHARE:
+            return _duplicated_rows(df)
+        row_hashes = np.concatenate([row_hashes, _hash_row_blocks(df.iloc[_HASH_CHUNK_ROWS:])])
+    
+    codes, _ = pd.factorize(row_hashes)
+    candidates = np.flatnonzero(np.bincount(codes)[codes] > 1)
+    
+    duplicate_mask = np.zeros(len(df), dtype=bool)
+    if candidates.size == 0:
+        return duplicate_mask, 0
+    if candidates.size > len(df) * _DUPLICATE_CANDIDATE_SHARE:
+        return _duplicated_rows(df)
+    
+    candidate_rows = df.iloc[candidates]
+    duplicate_mask[candidates] = candidate_rows.duplicated(keep=False).to_numpy()
+    return duplicate_mask, int(candidate_rows.duplicated().sum())
+
+
+def _duplicated_rows(df: pd.DataFrame) -> Tuple[np.ndarray, int]:
+    """Compare every row with ``duplicated``, returning the same pair as ``_find_duplicate_rows``."""
+    return df.duplicated(keep=False).to_numpy(), int(df.duplicated().sum())
+
+
+def _repeated_share(row_hashes: np.ndarray) -> float:
+    """Return the share of non-empty ``row_hashes`` whose value occurs more than once."""
+    codes, _ = pd.factorize(row_hashes)
+    return np.count_nonzero(np.bincount(codes)[codes] > 1) / row_hashes.size
+
+
+def _hash_row_blocks(df: pd.DataFrame) -> np.ndarray:
+    """Hash rows a bounded block at a time so per-column temporaries stay small."""
+    row_hashes = np.zeros(len(df), dtype=np.uint64)
+    float_positions = [
+        position for position, dtype in enumerate(df.dtypes)
+        if pd.api.types.is_float_dtype(dtype)
+    ]
+    
+    for start in range(0, len(df), _HASH_CHUNK_ROWS):
+        block = df.iloc[start:start + _HASH_CHUNK_ROWS]
+        if float_positions:
+            # duplicated() treats -0.0 as 0.0 and every NaN as equal, so give
+            # each of them a single bit pattern before hashing
+            block = block.copy(deep=False)
+            for position in float_positions:
+                values = block.iloc[:, position]
+                block.isetitem(position, (values + 0.0).where(values.notna()))
+        row_hashes[start:start + _HASH_CHUNK_ROWS] = pd.util.hash_pandas_object(block, index=False).to_numpy()
+    return row_hashes
+
+
+def _build_summary(results: Dict[str, Any], total_rows: int, total_columns: int) -> Dict[str, Any]:
+    """Count issues across check results and derive the overall quality score."""
+    total_issues = 0
+    if results.get('missing_values'):
+        total_issues += sum(1 for col in results['missing_values'].values() if col['has_missing'])
+    
+    if results.get('duplicates', {}).get('has_duplicates'):
+        total_issues += 1
+        
+    if results.get('schema_issues'):
+        total_issues += len(results['schema_issues'])
+    
+    return {
+        'total_rows': total_rows,
+        'total_columns': total_columns,
+        'total_issues': total_issues,
+        'data_quality_score': max(0, 100 - (total_issues * 10))  # Simple scoring
+    }
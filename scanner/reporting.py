@@ -5,296 +5,411 @@ This module provides functionality to generate visual and text reports
 from data quality check results.
 """
 
+from __future__ import annotations
+
+import copy
+from collections import Counter
+from itertools import compress
+
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-from typing import Dict, Any, List
+import numpy as np
+from typing import TYPE_CHECKING, Dict, Any, List
 import io
-import base64
+
+# Plotly is heavy to import and only the chart builders need it, so it is
+# imported where a figure is built (_unvalidated_figure); text and table
+# reports never load it
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+
+# Schema issue types reported with High severity in the issue summary table
+_HIGH_SEVERITY_ISSUES = frozenset({'mixed_types'})
+
+# Full text report for results without any issues; only the summary figures vary
+_CLEAN_REPORT_TEMPLATE = (
+    f"{'=' * 50}\nDATA QUALITY ANALYSIS REPORT\n{'=' * 50}\n\n"
+    "SUMMARY:\n"
+    "  Total Rows: {rows:,}\n"
+    "{sample_note}"
+    "  Total Columns: {cols}\n"
+    "  Data Quality Score: {score}/100\n\n"
+    "RECOMMENDATIONS:\n"
+    "  SUCCESS: Data quality is good. Minor improvements recommended."
+)
 
 
 class ReportGenerator:
     """Generate reports and visualizations from data quality results."""
     
+    # Missing value aggregates switch to NumPy reductions above this many columns
+    _ARRAY_REDUCTION_THRESHOLD = 1000
+    
+    # Layout shared by every placeholder chart; only the annotation text varies
+    _EMPTY_CHART_LAYOUT = {
+        'height': 400,
+        'xaxis': {'visible': False},
+        'yaxis': {'visible': False},
+        'annotations': [{
+            'text': '',
+            'xref': 'paper', 'yref': 'paper',
+            'x': 0.5, 'y': 0.5, 'xanchor': 'center', 'yanchor': 'middle',
+            'showarrow': False, 'font': {'size': 16}
+        }]
+    }
+    
     def __init__(self, results: Dict[str, Any], df: pd.DataFrame):
         """Initialize with quality check results and original DataFrame."""
         self.results = results
         self.df = df
+        
+        # Results are fixed for the lifetime of the generator, so the sections
+        # and missing value aggregates every report and chart needs are bound once here
+        self._summary = results.get('summary', {})
+        self._duplicates = results.get('duplicates', {})
+        self._schema_issues = results.get('schema_issues', {})
+        self._approx = results.get('approx')
+        
+        missing_values = results.get('missing_values', {})
+        self._missing_items = list(missing_values.items())
+        if len(self._missing_items) > self._ARRAY_REDUCTION_THRESHOLD:
+            # Wide frames: reduce over flat NumPy arrays instead of Python generators
+            counts = np.fromiter(
+                (data['count'] for _, data in self._missing_items),
+                dtype=np.int64, count=len(self._missing_items)
+            )
+            has_missing = np.fromiter(
+                (data['has_missing'] for _, data in self._missing_items),
+                dtype=np.bool_, count=len(self._missing_items)
+            )
+            self._columns_with_missing = list(compress(self._missing_items, has_missing))
+            self._total_missing_cells = int(counts.sum())
+        else:
+            self._columns_with_missing = [(col, data) for col, data in self._missing_items if data['has_missing']]
+            self._total_missing_cells = sum(data['count'] for _, data in self._missing_items)
+        self._summary_stats = None
     
     def generate_summary_stats(self) -> Dict[str, Any]:
         """Generate summary statistics for the dashboard."""
-        summary = self.results.get('summary', {})
-        missing_values = self.results.get('missing_values', {})
-        duplicates = self.results.get('duplicates', {})
-        schema_issues = self.results.get('schema_issues', {})
-        
-        # Calculate key metrics
-        columns_with_missing = sum(1 for col in missing_values.values() if col['has_missing'])
-        total_missing_cells = sum(col['count'] for col in missing_values.values())
+        if self._summary_stats is None:
+            summary = self._summary
+            
+            self._summary_stats = {
+                'total_rows': summary.get('total_rows', 0),
+                'total_columns': summary.get('total_columns', 0),
+                'data_quality_score': summary.get('data_quality_score', 0),
+                'columns_with_missing': len(self._columns_with_missing),
+                'total_missing_cells': self._total_missing_cells,
+                'duplicate_rows': self._duplicates.get('count', 0),
+                'schema_issues_count': len(self._schema_issues),
+                'has_issues': summary.get('total_issues', 0) > 0
+            }
         
-        return {
-            'total_rows': summary.get('total_rows', 0),
-            'total_columns': summary.get('total_columns', 0),
-            'data_quality_score': summary.get('data_quality_score', 0),
-            'columns_with_missing': columns_with_missing,
-            'total_missing_cells': total_missing_cells,
-            'duplicate_rows': duplicates.get('count', 0),
-            'schema_issues_count': len(schema_issues),
-            'has_issues': summary.get('total_issues', 0) > 0
-        }
+        # Hand out a copy so callers cannot alter the cached stats
+        return dict(self._summary_stats)
     
     def create_missing_values_chart(self) -> go.Figure:
         """Create a bar chart showing missing values by column."""
-        missing_values = self.results.get('missing_values', {})
-        
-        if not missing_values:
+        if not self._missing_items:
             return self._create_empty_chart("No missing value data available")
         
-        columns = list(missing_values.keys())
-        percentages = [missing_values[col]['percentage'] for col in columns]
-        
-        fig = go.Figure(data=[
-            go.Bar(
-                x=columns,
-                y=percentages,
-                marker_color=['#ff7f7f' if p > 0 else '#90EE90' for p in percentages],
-                text=[f"{p}%" for p in percentages],
-                textposition='auto'
-            )
-        ])
-        
-        fig.update_layout(
-            title="Missing Values by Column (%)",
-            xaxis_title="Columns",
-            yaxis_title="Missing Percentage (%)",
-            height=400,
-            showlegend=False
+        columns = [col for col, _ in self._missing_items]
+        percentages = np.fromiter(
+            (data['percentage'] for _, data in self._missing_items),
+            dtype=np.float64, count=len(self._missing_items)
         )
         
-        return fig
+        return _unvalidated_figure(
+            data=[{
+                'type': 'bar',
+                'x': columns,
+                'y': percentages,
+                'marker': {'color': np.where(percentages > 0, '#ff7f7f', '#90EE90')},
+                'text': np.char.add(percentages.astype(str), '%'),
+                'textposition': 'auto'
+            }],
+            layout={
+                'title': {'text': "Missing Values by Column (%)"},
+                'xaxis': {'title': {'text': "Columns"}},
+                'yaxis': {'title': {'text': "Missing Percentage (%)"}},
+                'height': 400,
+                'showlegend': False
+            }
+        )
     
     def create_duplicate_visualization(self) -> go.Figure:
         """Create visualization for duplicate analysis."""
-        duplicates = self.results.get('duplicates', {})
+        duplicates = self._duplicates
         
         if not duplicates.get('has_duplicates'):
             return self._create_empty_chart("No duplicates found")
         
         duplicate_count = duplicates.get('count', 0)
-        total_rows = self.results.get('summary', {}).get('total_rows', 1)
+        total_rows = self._summary.get('total_rows', 1)
         unique_rows = total_rows - duplicate_count
         
-        fig = go.Figure(data=[
-            go.Pie(
-                labels=['Unique Rows', 'Duplicate Rows'],
-                values=[unique_rows, duplicate_count],
-                marker_colors=['#90EE90', '#ff7f7f']
-            )
-        ])
-        
-        fig.update_layout(
-            title=f"Duplicate Analysis: {duplicate_count} duplicates found",
-            height=400
+        return _unvalidated_figure(
+            data=[{
+                'type': 'pie',
+                'labels': ['Unique Rows', 'Duplicate Rows'],
+                'values': np.array([unique_rows, duplicate_count], dtype=np.int64),
+                'marker': {'colors': ['#90EE90', '#ff7f7f']}
+            }],
+            layout={
+                'title': {'text': f"Duplicate Analysis: {duplicate_count} duplicates found"},
+                'height': 400
+            }
         )
-        
-        return fig
     
     def create_data_types_chart(self) -> go.Figure:
         """Create a chart showing data types distribution."""
-        data_types = self.df.dtypes.value_counts()
-        
-        fig = go.Figure(data=[
-            go.Bar(
-                x=data_types.index.astype(str),
-                y=data_types.values,
-                marker_color='#87CEEB',
-                text=data_types.values,
-                textposition='auto'
-            )
-        ])
-        
-        fig.update_layout(
-            title="Data Types Distribution",
-            xaxis_title="Data Types",
-            yaxis_title="Number of Columns",
-            height=400,
-            showlegend=False
+        # Most common first, matching Series.value_counts ordering
+        data_types = Counter(str(dtype) for dtype in self.df.dtypes.values).most_common()
+        labels = [label for label, _ in data_types]
+        counts = np.fromiter((count for _, count in data_types), dtype=np.int64, count=len(data_types))
+        
+        return _unvalidated_figure(
+            data=[{
+                'type': 'bar',
+                'x': labels,
+                'y': counts,
+                'marker': {'color': '#87CEEB'},
+                'text': counts,
+                'textposition': 'auto'
+            }],
+            layout={
+                'title': {'text': "Data Types Distribution"},
+                'xaxis': {'title': {'text': "Data Types"}},
+                'yaxis': {'title': {'text': "Number of Columns"}},
+                'height': 400,
+                'showlegend': False
+            }
         )
-        
-        return fig
     
     def create_schema_issues_chart(self) -> go.Figure:
         """Create visualization for schema issues."""
-        schema_issues = self.results.get('schema_issues', {})
+        schema_issues = self._schema_issues
         
         if not schema_issues:
             return self._create_empty_chart("No schema issues detected")
         
         columns = list(schema_issues.keys())
-        issue_counts = [len(issues) for issues in schema_issues.values()]
-        
-        fig = go.Figure(data=[
-            go.Bar(
-                x=columns,
-                y=issue_counts,
-                marker_color='#ffa500',
-                text=issue_counts,
-                textposition='auto'
-            )
-        ])
-        
-        fig.update_layout(
-            title="Schema Issues by Column",
-            xaxis_title="Columns",
-            yaxis_title="Number of Issues",
-            height=400,
-            showlegend=False
+        issue_counts = np.fromiter(
+            (len(issues) for issues in schema_issues.values()),
+            dtype=np.int32, count=len(schema_issues)
         )
         
-        return fig
+        return _unvalidated_figure(
+            data=[{
+                'type': 'bar',
+                'x': columns,
+                'y': issue_counts,
+                'marker': {'color': '#ffa500'},
+                'text': issue_counts,
+                'textposition': 'auto'
+            }],
+            layout={
+                'title': {'text': "Schema Issues by Column"},
+                'xaxis': {'title': {'text': "Columns"}},
+                'yaxis': {'title': {'text': "Number of Issues"}},
+                'height': 400,
+                'showlegend': False
+            }
+        )
     
     def create_data_quality_score_gauge(self) -> go.Figure:
         """Create a gauge chart for overall data quality score."""
-        score = self.results.get('summary', {}).get('data_quality_score', 0)
-        
-        fig = go.Figure(go.Indicator(
-            mode = "gauge+number+delta",
-            value = score,
-            domain = {'x': [0, 1], 'y': [0, 1]},
-            title = {'text': "Data Quality Score"},
-            delta = {'reference': 100},
-            gauge = {
-                'axis': {'range': [None, 100]},
-                'bar': {'color': "darkblue"},
-                'steps': [
-                    {'range': [0, 50], 'color': "lightgray"},
-                    {'range': [50, 80], 'color': "yellow"},
-                    {'range': [80, 100], 'color': "green"}
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 90
+        score = self._summary.get('data_quality_score', 0)
+        
+        return _unvalidated_figure(
+            data=[{
+                'type': 'indicator',
+                'mode': "gauge+number+delta",
+                'value': score,
+                'domain': {'x': [0, 1], 'y': [0, 1]},
+                'title': {'text': "Data Quality Score"},
+                'delta': {'reference': 100},
+                'gauge': {
+                    'axis': {'range': [None, 100]},
+                    'bar': {'color': "darkblue"},
+                    'steps': [
+                        {'range': [0, 50], 'color': "lightgray"},
+                        {'range': [50, 80], 'color': "yellow"},
+                        {'range': [80, 100], 'color': "green"}
+                    ],
+                    'threshold': {
+                        'line': {'color': "red", 'width': 4},
+                        'thickness': 0.75,
+                        'value': 90
+                    }
                 }
-            }
-        ))
-        
-        fig.update_layout(height=400)
-        return fig
+            }],
+            layout={'height': 400}
+        )
+    
+    def figures_json(self) -> bytes:
+        """
+        Serialize every dashboard chart into one JSON document keyed by chart name.
+        
+        Uses Plotly's JSON encoder, which runs on orjson when it is installed,
+        so the NumPy trace arrays are encoded without an intermediate list copy.
+        """
+        from plotly.io.json import to_json_plotly
+        
+        figures = {
+            'missing_values': self.create_missing_values_chart(),
+            'duplicates': self.create_duplicate_visualization(),
+            'data_types': self.create_data_types_chart(),
+            'schema_issues': self.create_schema_issues_chart(),
+            'data_quality_score': self.create_data_quality_score_gauge()
+        }
+        return to_json_plotly(
+            {name: fig.to_plotly_json() for name, fig in figures.items()}
+        ).encode('utf-8')
     
     def generate_text_report(self) -> str:
         """Generate a text summary report."""
         stats = self.generate_summary_stats()
-        missing_values = self.results.get('missing_values', {})
-        duplicates = self.results.get('duplicates', {})
-        schema_issues = self.results.get('schema_issues', {})
+        if not stats['has_issues'] and stats['data_quality_score'] >= 90:
+            return _CLEAN_REPORT_TEMPLATE.format(
+                rows=self._report_total_rows(stats),
+                sample_note=self._sample_note(),
+                cols=stats['total_columns'],
+                score=stats['data_quality_score']
+            )
         
-        report = []
-        report.append("=" * 50)
-        report.append("DATA QUALITY ANALYSIS REPORT")
-        report.append("=" * 50)
-        report.append("")
+        schema_issues = self._schema_issues
+        
+        buffer = io.StringIO()
+        write = buffer.write
+        rule = "=" * 50
+        
+        write(f"{rule}\nDATA QUALITY ANALYSIS REPORT\n{rule}\n\n")
         
         # Summary
-        report.append("SUMMARY:")
-        report.append(f"  Total Rows: {stats['total_rows']:,}")
-        report.append(f"  Total Columns: {stats['total_columns']}")
-        report.append(f"  Data Quality Score: {stats['data_quality_score']}/100")
-        report.append("")
+        write(
+            "SUMMARY:\n"
+            f"  Total Rows: {self._report_total_rows(stats):,}\n"
+            f"{self._sample_note()}"
+            f"  Total Columns: {stats['total_columns']}\n"
+            f"  Data Quality Score: {stats['data_quality_score']}/100\n\n"
+        )
         
         # Missing Values
         if stats['columns_with_missing'] > 0:
-            report.append("MISSING VALUES:")
-            for col, data in missing_values.items():
-                if data['has_missing']:
-                    report.append(f"  {col}: {data['count']} missing ({data['percentage']}%)")
-            report.append("")
+            write("MISSING VALUES:\n")
+            for col, data in self._columns_with_missing:
+                write(f"  {col}: {data['count']} missing ({data['percentage']}%)\n")
+            write("\n")
         
         # Duplicates
         if stats['duplicate_rows'] > 0:
-            report.append("DUPLICATES:")
-            report.append(f"  {stats['duplicate_rows']} duplicate rows found")
-            report.append("")
+            write(f"DUPLICATES:\n  {stats['duplicate_rows']} duplicate rows found\n\n")
         
         # Schema Issues
         if stats['schema_issues_count'] > 0:
-            report.append("SCHEMA ISSUES:")
+            write("SCHEMA ISSUES:\n")
             for col, issues in schema_issues.items():
-                report.append(f"  {col}:")
+                write(f"  {col}:\n")
                 for issue_type, details in issues.items():
-                    report.append(f"    - {issue_type}: {details}")
-            report.append("")
+                    write(f"    - {issue_type}: {details}\n")
+            write("\n")
         
         # Recommendations
-        report.append("RECOMMENDATIONS:")
+        write("RECOMMENDATIONS:\n")
         if stats['data_quality_score'] < 70:
-            report.append("  WARNING: Data quality is poor. Immediate attention required.")
+            write("  WARNING: Data quality is poor. Immediate attention required.\n")
         elif stats['data_quality_score'] < 90:
-            report.append("  WARNING: Data quality is fair. Consider addressing identified issues.")
+            write("  WARNING: Data quality is fair. Consider addressing identified issues.\n")
         else:
-            report.append("  SUCCESS: Data quality is good. Minor improvements recommended.")
+            write("  SUCCESS: Data quality is good. Minor improvements recommended.\n")
         
         if stats['columns_with_missing'] > 0:
-            report.append("  - Address missing values in affected columns")
+            write("  - Address missing values in affected columns\n")
         if stats['duplicate_rows'] > 0:
-            report.append("  - Remove or investigate duplicate rows")
+            write("  - Remove or investigate duplicate rows\n")
         if stats['schema_issues_count'] > 0:
-            report.append("  - Standardize data formats in affected columns")
+            write("  - Standardize data formats in affected columns\n")
         
-        return "\n".join(report)
+        # Every line was written with a newline; the report has no trailing one
+        return buffer.getvalue()[:-1]
     
     def _create_empty_chart(self, message: str) -> go.Figure:
         """Create an empty chart with a message."""
-        fig = go.Figure()
-        fig.add_annotation(
-            text=message,
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, xanchor='center', yanchor='middle',
-            showarrow=False, font_size=16
-        )
-        fig.update_layout(
-            height=400,
-            xaxis={'visible': False},
-            yaxis={'visible': False}
-        )
-        return fig
+        spec = copy.deepcopy(self._EMPTY_CHART_LAYOUT)
+        spec['annotations'][0]['text'] = message
+        return _unvalidated_figure(data=[], layout=spec)
+    
+    def _report_total_rows(self, stats: Dict[str, Any]) -> int:
+        """Return the row count of the scanned frame, not of the sample checked."""
+        return self._approx['total_rows'] if self._approx else stats['total_rows']
+    
+    def _sample_note(self) -> str:
+        """Return the report line noting that counts come from a sample, if they do."""
+        if not self._approx:
+            return ""
+        return f"  Rows Checked: {self._approx['sample_rows']:,} (random sample; counts are approximate)\n"
     
     def get_issue_summary_table(self) -> pd.DataFrame:
         """Create a summary table of all issues found."""
-        issues = []
+        # Parallel column lists, turned into a DataFrame in one constructor call
+        types, columns, severities, details_list = [], [], [], []
         
         # Missing value issues
-        missing_values = self.results.get('missing_values', {})
-        for col, data in missing_values.items():
-            if data['has_missing']:
-                issues.append({
-                    'Type': 'Missing Values',
-                    'Column': col,
-                    'Severity': 'High' if data['percentage'] > 10 else 'Medium',
-                    'Details': f"{data['count']} missing ({data['percentage']}%)"
-                })
+        if self._columns_with_missing:
+            percentages = np.fromiter(
+                (data['percentage'] for _, data in self._columns_with_missing),
+                dtype=np.float64, count=len(self._columns_with_missing)
+            )
+            types.extend(['Missing Values'] * len(self._columns_with_missing))
+            columns.extend(col for col, _ in self._columns_with_missing)
+            severities.extend(np.where(percentages > 10, 'High', 'Medium').tolist())
+            details_list.extend(
+                f"{data['count']} missing ({data['percentage']}%)"
+                for _, data in self._columns_with_missing
+            )
         
         # Duplicate issues
-        duplicates = self.results.get('duplicates', {})
+        duplicates = self._duplicates
         if duplicates.get('has_duplicates'):
-            issues.append({
-                'Type': 'Duplicates',
-                'Column': 'All',
-                'Severity': 'Medium',
-                'Details': f"{duplicates['count']} duplicate rows"
-            })
+            types.append('Duplicates')
+            columns.append('All')
+            severities.append('Medium')
+            details_list.append(f"{duplicates['count']} duplicate rows")
         
         # Schema issues
-        schema_issues = self.results.get('schema_issues', {})
+        schema_issues = self._schema_issues
         for col, col_issues in schema_issues.items():
             for issue_type, details in col_issues.items():
-                severity = 'High' if 'mixed_types' in issue_type else 'Medium'
-                issues.append({
-                    'Type': f'Schema Issue: {issue_type}',
-                    'Column': col,
-                    'Severity': severity,
-                    'Details': str(details)
-                })
-        
-        return pd.DataFrame(issues)
+                types.append(f'Schema Issue: {issue_type}')
+                columns.append(col)
+                severities.append('High' if issue_type in _HIGH_SEVERITY_ISSUES else 'Medium')
+                details_list.append(str(details))
+        
+        if self._approx:
+            # Counts in the details cover the sampled rows only
+            scope = f" (in a sample of {self._approx['sample_rows']:,} rows)"
+            details_list = [details + scope for details in details_list]
+        
+        return pd.DataFrame({
+            'Type': types,
+            'Column': columns,
+            'Severity': severities,
+            'Details': details_list
+        })
+
+
+def _unvalidated_figure(data: List[Dict[str, Any]], layout: Dict[str, Any]) -> go.Figure:
+    """
+    Wrap a plain figure spec in a go.Figure without Plotly's property validation.
+    
+    The chart builders only produce specs from known-good, module-defined
+    properties, so the recursive per-property validation is pure overhead.
+    Specs must therefore use the canonical nested form (e.g. ``marker.color``
+    rather than the ``marker_color`` shorthand). Numeric trace data should be
+    NumPy arrays of a fixed dtype so the JSON output uses Plotly's base64
+    typed-array encoding instead of per-element number lists.
+    """
+    import plotly.graph_objects as go
+    
+    return go.Figure({'data': data, 'layout': layout}, _validate=False)
@@ -0,0 +1,201 @@
+"""
+Unit tests for the Data Quality Scanner application helpers.
+"""
+
+import io
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+import pandas as pd
+import numpy as np
+import app
+from app import (
+    CATEGORY_UNIQUE_RATIO, downcast_dataframe, get_results, load_csv, load_cached_results, store_cached_results
+)
+from scanner import DataQualityChecker
+
+
+class TestLoadCsv(unittest.TestCase):
+    """Test cases for load_csv."""
+    
+    def test_progress_follows_bytes_read(self):
+        """Test that the upload is parsed whole while the progress bar runs to completion."""
+        expected = pd.DataFrame({'id': range(50_000), 'name': 'row'})
+        upload = io.BytesIO(expected.to_csv(index=False).encode())
+        upload.size = len(upload.getvalue())
+        upload.read()  # A previous rerun may have left the position at the end
+        
+        progress_bar = MagicMock()
+        with patch.object(app.st, 'progress', return_value=progress_bar):
+            df = load_csv(upload)
+        
+        pd.testing.assert_frame_equal(df, expected)
+        fractions = [call.args[0] for call in progress_bar.progress.call_args_list]
+        self.assertEqual(fractions, sorted(fractions))
+        self.assertEqual(fractions[-1], 1.0)
+        progress_bar.empty.assert_called_once()
+
+
+
+class TestDowncastDataFrame(unittest.TestCase):
+    """Test cases for downcast_dataframe."""
+    
+    def test_integers_shrink_to_smallest_type(self):
+        """Test that integer columns take the smallest type holding their values."""
+        df = pd.DataFrame({'small': [1, 2, 3], 'large': [1, 2, 70_000]})
+        narrowed = downcast_dataframe(df)
+        
+        self.assertEqual(narrowed['small'].dtype, np.int8)
+        self.assertEqual(narrowed['large'].dtype, np.int32)
+        self.assertEqual(narrowed['large'].tolist(), [1, 2, 70_000])
+    
+    def test_floats_narrow_only_when_lossless(self):
+        """Test that floats drop to float32 only when every value round-trips."""
+        df = pd.DataFrame({'exact': [0.5, 1.25, np.nan], 'inexact': [0.1, 1.25, np.nan]})
+        narrowed = downcast_dataframe(df)
+        
+        self.assertEqual(narrowed['exact'].dtype, np.float32)
+        self.assertEqual(narrowed['inexact'].dtype, np.float64)
+        self.assertEqual(narrowed['inexact'].iloc[0], 0.1)
+    
+    def test_category_threshold(self):
+        """Test that only text columns below the unique-value ratio become categoricals."""
+        rows = 10
+        distinct = int(rows * CATEGORY_UNIQUE_RATIO)
+        df = pd.DataFrame({
+            'repetitive': [f'v{i % (distinct - 1)}' for i in range(rows)],
+            'at_threshold': [f'v{i % distinct}' for i in range(rows)]
+        })
+        narrowed = downcast_dataframe(df)
+        
+        self.assertIsInstance(narrowed['repetitive'].dtype, pd.CategoricalDtype)
+        self.assertNotIsInstance(narrowed['at_threshold'].dtype, pd.CategoricalDtype)
+    
+    def test_input_frame_unchanged(self):
+        """Test that the parsed frame keeps its dtypes for display."""
+        df = pd.DataFrame({'id': [1, 2, 3], 'category': ['A', 'A', 'A']})
+        downcast_dataframe(df)
+        
+        self.assertEqual(df['id'].dtype, np.int64)
+        self.assertNotIsInstance(df['category'].dtype, pd.CategoricalDtype)
+
+
+
+class TestResultsCache(unittest.TestCase):
+    """Test cases for the on-disk results cache."""
+    
+    def setUp(self):
+        """Point the cache at a temporary directory."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cache_dir = Path(temp_dir.name)
+        patcher = patch.object(app, 'RESULTS_CACHE_DIR', self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_private_entries_not_persisted(self):
+        """Test that stored results round-trip without their private entries."""
+        df = pd.DataFrame({'id': [1, 1, 2]})
+        results = DataQualityChecker(df).run_all_checks()
+        store_cached_results('abc', results)
+        
+        loaded = load_cached_results('abc')
+        self.assertNotIn('_mask', loaded['duplicates'])
+        self.assertEqual(loaded['duplicates']['duplicate_rows'], [0, 1])
+        self.assertEqual(loaded['summary'], results['summary'])
+    
+    def test_results_format_bump_invalidates(self):
+        """Test that results stored under an older results format are not reused."""
+        store_cached_results('abc', {'summary': {}})
+        with patch.object(app, 'RESULTS_FORMAT_VERSION', app.RESULTS_FORMAT_VERSION + 1):
+            self.assertIsNone(load_cached_results('abc'))
+        self.assertEqual(load_cached_results('abc'), {'summary': {}})
+    
+    def test_least_recently_used_entries_evicted(self):
+        """Test that the cache keeps only the most recently used entries."""
+        with patch.object(app, 'RESULTS_CACHE_MAX_ENTRIES', 2):
+            for fingerprint in ('old', 'used'):
+                store_cached_results(fingerprint, {'summary': {}})
+                os.utime(app._cache_path(fingerprint), (0, 0))
+            load_cached_results('used')
+            store_cached_results('new', {'summary': {}})
+        
+        self.assertEqual(
+            sorted(path.name.split('-')[0] for path in self.cache_dir.glob('*.pkl')),
+            ['new', 'used']
+        )
+
+
+
+class TestGetResults(unittest.TestCase):
+    """Test cases for progressive results with a background exact scan."""
+    
+    def setUp(self):
+        """Isolate session state, the disk cache and the scan pool."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(self.executor.shutdown)
+        self.session_state = {}
+        self.df = pd.DataFrame({'id': [1, 2, 3]})
+        
+        fast_results = lambda fingerprint, df, mode='exact': {'mode': mode}
+        for target, value in [
+            ('RESULTS_CACHE_DIR', Path(temp_dir.name)),
+            ('FAST_SAMPLE_ROWS', 2),
+            ('run_checks', fast_results),
+            ('background_executor', lambda: self.executor),
+        ]:
+            patcher = patch.object(app, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch.object(app.st, 'session_state', self.session_state)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def pending_future(self):
+        """Return the exact scan future tracked by the session."""
+        return self.session_state['exact_checks'][1]
+    
+    def test_sampled_until_exact_scan_finishes(self):
+        """Test that sampled results are shown until the exact ones are ready."""
+        release = threading.Event()
+        
+        def exact_scan(fingerprint, df):
+            release.wait()
+            return {'mode': 'exact'}
+        
+        with patch.object(app, 'run_exact_checks', exact_scan):
+            self.assertEqual(get_results('a', self.df), ({'mode': 'fast'}, 'running'))
+            release.set()
+            self.pending_future().result()
+            self.assertEqual(get_results('a', self.df), ({'mode': 'exact'}, None))
+    
+    def test_failed_scan_keeps_sampled_results(self):
+        """Test that a failing exact scan falls back to the sampled results."""
+        with patch.object(app, 'run_exact_checks', side_effect=RuntimeError):
+            get_results('a', self.df)
+            self.pending_future().exception()
+            self.assertEqual(get_results('a', self.df), ({'mode': 'fast'}, 'failed'))
+    
+    def test_superseded_scan_cancelled(self):
+        """Test that a queued scan for a replaced dataset is cancelled."""
+        release = threading.Event()
+        self.executor.submit(release.wait)  # Occupy the only worker
+        self.addCleanup(release.set)
+        
+        with patch.object(app, 'run_exact_checks', return_value={'mode': 'exact'}):
+            get_results('a', self.df)
+            superseded = self.pending_future()
+            get_results('b', self.df)
+        
+        self.assertTrue(superseded.cancelled())
+        self.assertEqual(self.session_state['exact_checks'][0], 'b')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@ Unit tests for the Data Quality Scanner checks module.
 """
 
 import unittest
+from unittest.mock import patch
 import pandas as pd
 import numpy as np
 from scanner.checks import DataQualityChecker
@@ -11,16 +12,17 @@ from scanner.checks import DataQualityChecker
 class TestDataQualityChecker(unittest.TestCase):
     """Test cases for DataQualityChecker class."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.test_data = pd.DataFrame({
+    @classmethod
+    def setUpClass(cls):
+        """Set up test data and a checker shared by every test."""
+        cls.test_data = pd.DataFrame({
             'id': [1, 2, None, 4, 1],
             'email': ['test@email.com', 'invalid-email', 'test@email.com', 'user@email.com', 'test@email.com'],
             'date': ['2024-01-01', '01/01/2024', '2024-01-03', '2024-01-04', '2024-01-01'],
             'amount': [100.50, 85.00, 'invalid', 95.25, 100.50],
             'category': ['A', 'B', 'A', 'B', 'A']
         })
-        self.checker = DataQualityChecker(self.test_data)
+        cls.checker = DataQualityChecker(cls.test_data)
     
     def test_missing_values_detection(self):
         """Test missing value detection."""
@@ -41,6 +43,38 @@ class TestDataQualityChecker(unittest.TestCase):
         self.assertEqual(results['count'], 1)  # One duplicate row
         self.assertEqual(results['percentage'], 20.0)
     
+    def test_duplicates_with_unhashable_cells(self):
+        """Test duplicate detection on columns holding lists."""
+        data = pd.DataFrame({'tags': [['a'], ['b'], ['a']], 'value': [1, 2, 1]})
+        results = DataQualityChecker(data).check_duplicates()
+        
+        self.assertEqual(results['count'], 1)
+        self.assertEqual(results['duplicate_rows'], [0, 2])
+    
+    def test_duplicates_match_pandas_equality(self):
+        """Test that duplicate detection agrees with DataFrame.duplicated."""
+        mixed = pd.DataFrame({'value': pd.Series([1, '1', None, np.nan], dtype=object)})
+        self.assertEqual(DataQualityChecker(mixed).check_duplicates()['count'], 0)
+        
+        signed_zeros = pd.DataFrame({'value': [0.0, -0.0, np.nan, np.nan]})
+        results = DataQualityChecker(signed_zeros).check_duplicates()
+        self.assertEqual(results['count'], 2)
+        self.assertEqual(results['duplicate_rows'], [0, 1, 2, 3])
+        
+        no_columns = pd.DataFrame(index=range(3))
+        self.assertEqual(DataQualityChecker(no_columns).check_duplicates()['count'], 0)
+    
+    def test_duplicates_across_hash_blocks(self):
+        """Test that mostly-repeated and mostly-unique frames agree with DataFrame.duplicated."""
+        low_cardinality = pd.DataFrame({'value': [1, 2] * 10, 'flag': [1.5, np.nan] * 10})
+        mostly_unique = pd.DataFrame({'value': list(range(18)) + [3, 17], 'flag': 0.5})
+    
+        with patch('scanner.checks._HASH_CHUNK_ROWS', 4):
+            for data in (low_cardinality, mostly_unique):
+                results = DataQualityChecker(data).check_duplicates()
+                self.assertEqual(results['count'], int(data.duplicated().sum()))
+                self.assertEqual(results['duplicate_rows'], np.flatnonzero(data.duplicated(keep=False)).tolist())
+    
     def test_schema_validation(self):
         """Test schema validation."""
         results = self.checker.check_schema_validation()
@@ -49,6 +83,98 @@ class TestDataQualityChecker(unittest.TestCase):
         self.assertIn('date', results)
         self.assertIn('amount', results)
     
+    def test_schema_validation_parallel_matches_serial(self):
+        """Test that wide frames checked on the thread pool match a serial run."""
+        copies = DataQualityChecker._PARALLEL_COLUMN_THRESHOLD // len(self.test_data.columns) + 1
+        wide = pd.concat([self.test_data.add_suffix(f'_{copy}') for copy in range(copies)], axis=1)
+        self.assertGreaterEqual(len(wide.columns), DataQualityChecker._PARALLEL_COLUMN_THRESHOLD)
+        
+        parallel = DataQualityChecker(wide).check_schema_validation()
+        with patch.object(DataQualityChecker, '_PARALLEL_COLUMN_THRESHOLD', len(wide.columns) + 1):
+            serial = DataQualityChecker(wide).check_schema_validation()
+        
+        self.assertEqual(parallel, serial)
+        self.assertIn('amount_0', parallel)
+    
+    def test_schema_validation_reuses_null_mask(self):
+        """Test that schema results match whether or not nulls were counted first."""
+        data = pd.DataFrame({
+            'amount': [100.50, None, 'invalid', 95.25, None],
+            'date': ['2024-01-01', None, '01/01/2024', '2024-01-04', '2024-01-05']
+        })
+        standalone = DataQualityChecker(data).check_schema_validation()
+        
+        checker = DataQualityChecker(data)
+        checker.check_missing_values()
+        self.assertEqual(checker._non_null_masks, {})  # Only run_all_checks keeps masks
+        
+        self.assertEqual(checker.run_all_checks()['schema_issues'], standalone)
+        self.assertEqual(checker._non_null_masks, {})  # Freed after schema validation
+    
+    def test_date_formats_with_mixed_offsets(self):
+        """Test that ISO dates with differing or missing UTC offsets are one format."""
+        data = pd.DataFrame({'created_at': [
+            '2024-03-01T09:00:00-05:00', '2024-04-01T09:00:00-04:00', '2024-04-02T09:00:00'
+        ]})
+        results = DataQualityChecker(data).run_all_checks()
+        
+        self.assertNotIn('created_at', results['schema_issues'])
+    
+    def test_date_formats_with_mixed_separators(self):
+        """Test that dash- and slash-separated dates are reported as different formats."""
+        data = pd.DataFrame({'date': ['2024-01-02', '2024/01/03', '2024-01-04']})
+        results = DataQualityChecker(data).check_schema_validation()
+        
+        date_formats = results['date']['date_formats']
+        self.assertEqual(date_formats['format_distribution'], {'ISO8601': 2, 'YYYY/MM/DD': 1})
+        self.assertEqual(date_formats['unparseable_count'], 0)
+    
+    def test_date_formats_without_iso_values(self):
+        """Test that mixed non-ISO layouts are reported and free text is not parsed as dates."""
+        data = pd.DataFrame({
+            'date': ['01/15/2024', '02/16/2024', '15-01-2024', '16-02-2024'],
+            'updated': ['01/15/2024', '2024/01/16', 'Jan 5 2024', 'Jan 6 2024'],
+            'created_by': ['alice', 'bob', 'carol', 'dave']
+        })
+        results = DataQualityChecker(data).check_schema_validation()
+        
+        self.assertEqual(
+            results['date']['date_formats']['format_distribution'],
+            {'MM/DD/YYYY': 2, 'MM-DD-YYYY': 2}
+        )
+        self.assertEqual(
+            results['updated']['date_formats']['format_distribution'],
+            {'MM/DD/YYYY': 1, 'YYYY/MM/DD': 1, 'other': 2}
+        )
+        self.assertNotIn('date_formats', results.get('created_by', {}))
+    
+    def test_categorical_columns_match_text(self):
+        """Test that categoricals get the same findings as their expanded values."""
+        data = pd.DataFrame({
+            'signup_date': ['2024-01-02', '01/02/2024', 'Jan 3 2024', 'bad', '2024-01-02', None] * 5,
+            'amount': ['1', '2', '3', '1000', 'x', '2'] * 5,
+            'email': ['a@b.com', 'bad', 'c@d.org', 'bad', None, 'no'] * 5
+        })
+        text_results = DataQualityChecker(data).check_schema_validation()
+        categorical_results = DataQualityChecker(data.astype('category')).check_schema_validation()
+    
+        self.assertEqual(categorical_results, text_results)
+        self.assertEqual(set(text_results), {'signup_date', 'amount', 'email'})
+    
+    def test_email_format_matches_whole_values(self):
+        """Test that Arrow and object email checks agree on values with a trailing newline."""
+        emails = ['a@b.com', 'a@b.com\n', 'c@d.org', 'bad', 'e@f.net']
+        arrow_results = DataQualityChecker(pd.DataFrame({'email': emails})).check_schema_validation()
+        object_emails = pd.Series(emails + [42], dtype=object)  # Not pure strings, so no Arrow path
+        object_results = DataQualityChecker(pd.DataFrame({'email': object_emails})).check_schema_validation()
+    
+        arrow_format = arrow_results['email']['string_issues']['email_format']
+        object_format = object_results['email']['string_issues']['email_format']
+        self.assertEqual(arrow_format['valid_count'], 3)
+        self.assertEqual(object_format['valid_count'], 3)
+        self.assertIs(type(arrow_format['valid_percentage']), float)
+        self.assertIs(type(object_format['valid_percentage']), float)
+    
     def test_run_all_checks(self):
         """Test running all checks together."""
         results = self.checker.run_all_checks()
@@ -65,6 +191,28 @@ class TestDataQualityChecker(unittest.TestCase):
         self.assertEqual(summary['total_columns'], 5)
         self.assertGreater(summary['total_issues'], 0)
     
+    def test_run_all_checks_cached(self):
+        """Test that repeated runs reuse the first run's results."""
+        results = self.checker.run_all_checks()
+        
+        with patch.object(self.checker, 'check_missing_values') as check_missing_values:
+            self.assertIs(self.checker.run_all_checks(), results)
+            check_missing_values.assert_not_called()
+    
+    def test_fast_mode_samples_large_frames(self):
+        """Test that fast mode checks a sample and flags the results as approximate."""
+        results = DataQualityChecker(self.test_data, mode='fast', sample_rows=3).run_all_checks()
+        
+        self.assertEqual(results['approx'], {'sample_rows': 3, 'total_rows': 5})
+        self.assertEqual(results['summary']['total_rows'], 3)
+        
+        # Frames within the sample size are checked exactly
+        results = DataQualityChecker(self.test_data, mode='fast').run_all_checks()
+        self.assertNotIn('approx', results)
+        
+        with self.assertRaises(ValueError):
+            DataQualityChecker(self.test_data, mode='slow')
+    
     def test_data_quality_score_calculation(self):
         """Test data quality score calculation."""
         results = self.checker.run_all_checks()
@@ -81,16 +229,17 @@ class TestDataQualityChecker(unittest.TestCase):
 class TestCleanData(unittest.TestCase):
     """Test cases with clean data (no issues)."""
     
-    def setUp(self):
-        """Set up clean test data."""
-        self.clean_data = pd.DataFrame({
+    @classmethod
+    def setUpClass(cls):
+        """Set up clean test data and a checker shared by every test."""
+        cls.clean_data = pd.DataFrame({
             'id': [1, 2, 3, 4, 5],
             'email': ['a@email.com', 'b@email.com', 'c@email.com', 'd@email.com', 'e@email.com'],
             'date': ['2024-01-01', '2024-01-02', '2024-01-03', '2024-01-04', '2024-01-05'],
             'amount': [100.50, 85.00, 120.75, 95.25, 150.00],
             'category': ['A', 'B', 'C', 'D', 'E']
         })
-        self.checker = DataQualityChecker(self.clean_data)
+        cls.checker = DataQualityChecker(cls.clean_data)
     
     def test_clean_data_no_issues(self):
         """Test that clean data has no issues."""
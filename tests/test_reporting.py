@@ -0,0 +1,108 @@
+"""
+Unit tests for the Data Quality Scanner reporting module.
+"""
+
+import json
+import unittest
+import pandas as pd
+from scanner.checks import DataQualityChecker
+from scanner.reporting import ReportGenerator
+
+
+class TestReportGenerator(unittest.TestCase):
+    """Test cases for ReportGenerator class."""
+    
+    def setUp(self):
+        """Set up test data and check results."""
+        self.test_data = pd.DataFrame({
+            'id': [1, 2, None, 4, 1],
+            'email': ['test@email.com', 'invalid-email', 'test@email.com', 'user@email.com', 'test@email.com'],
+            'date': ['2024-01-01', '01/01/2024', '2024-01-03', '2024-01-04', '2024-01-01'],
+            'amount': [100.50, 85.00, 'invalid', 95.25, 100.50],
+            'category': ['A', 'B', 'A', 'B', 'A']
+        })
+        self.results = DataQualityChecker(self.test_data).run_all_checks()
+        self.reporter = ReportGenerator(self.results, self.test_data)
+    
+    def test_summary_stats(self):
+        """Test summary statistics derived from the results."""
+        stats = self.reporter.generate_summary_stats()
+        
+        self.assertEqual(stats['total_rows'], 5)
+        self.assertEqual(stats['columns_with_missing'], 1)
+        self.assertEqual(stats['total_missing_cells'], 1)
+        self.assertEqual(stats['duplicate_rows'], 1)
+        self.assertTrue(stats['has_issues'])
+    
+    def test_summary_stats_cached_copy(self):
+        """Test that callers cannot alter the cached summary statistics."""
+        stats = self.reporter.generate_summary_stats()
+        stats['total_rows'] = -1
+        
+        self.assertEqual(self.reporter.generate_summary_stats()['total_rows'], 5)
+    
+    def test_text_report(self):
+        """Test the text report sections."""
+        report = self.reporter.generate_text_report()
+        
+        self.assertIn("DATA QUALITY ANALYSIS REPORT", report)
+        self.assertIn("  id: 1 missing (20.0%)", report)
+        self.assertIn("  1 duplicate rows found", report)
+        self.assertIn("SCHEMA ISSUES:", report)
+    
+    def test_text_report_without_issues(self):
+        """Test the text report for a clean dataset."""
+        clean_data = pd.DataFrame({'id': [1, 2, 3], 'category': ['A', 'B', 'C']})
+        reporter = ReportGenerator(DataQualityChecker(clean_data).run_all_checks(), clean_data)
+        report = reporter.generate_text_report()
+        
+        self.assertIn("  Total Rows: 3\n  Total Columns: 2\n  Data Quality Score: 100/100", report)
+        self.assertTrue(report.endswith("  SUCCESS: Data quality is good. Minor improvements recommended."))
+        self.assertNotIn("MISSING VALUES:", report)
+    
+    def test_exports_note_sampled_results(self):
+        """Test that exports from sampled results give the full row count and flag the sample."""
+        results = DataQualityChecker(self.test_data, mode='fast', sample_rows=4).run_all_checks()
+        reporter = ReportGenerator(results, self.test_data)
+        
+        report = reporter.generate_text_report()
+        self.assertIn("  Total Rows: 5\n  Rows Checked: 4 (random sample; counts are approximate)\n", report)
+        
+        details = reporter.get_issue_summary_table()['Details']
+        self.assertTrue(details.str.endswith(" (in a sample of 4 rows)").all())
+    
+    def test_figures_json(self):
+        """Test that all charts serialize into one JSON document."""
+        payload = json.loads(self.reporter.figures_json())
+        
+        self.assertEqual(
+            set(payload),
+            {'missing_values', 'duplicates', 'data_types', 'schema_issues', 'data_quality_score'}
+        )
+        self.assertEqual(
+            payload['missing_values'],
+            json.loads(self.reporter.create_missing_values_chart().to_json())
+        )
+    
+    def test_issue_summary_table(self):
+        """Test the issue summary table."""
+        table = self.reporter.get_issue_summary_table()
+        
+        self.assertEqual(list(table.columns), ['Type', 'Column', 'Severity', 'Details'])
+        missing_row = table[table['Type'] == 'Missing Values'].iloc[0]
+        self.assertEqual(missing_row['Column'], 'id')
+        self.assertEqual(missing_row['Severity'], 'High')
+        self.assertIn('Duplicates', table['Type'].tolist())
+    
+    def test_issue_summary_table_without_issues(self):
+        """Test that a clean dataset yields an empty table with the usual columns."""
+        clean_data = pd.DataFrame({'id': [1, 2, 3], 'category': ['A', 'B', 'C']})
+        reporter = ReportGenerator(DataQualityChecker(clean_data).run_all_checks(), clean_data)
+        table = reporter.get_issue_summary_table()
+        
+        self.assertEqual(len(table), 0)
+        self.assertEqual(list(table.columns), ['Type', 'Column', 'Severity', 'Details'])
+
+
+if __name__ == '__main__':
+    unittest.main()